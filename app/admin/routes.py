@@ -2,13 +2,16 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime, date
 
-from fastapi import APIRouter, Request, Depends, Form, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import APIRouter, Request, Depends, Form, UploadFile, File, HTTPException, Query
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, Response
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.db.base import get_db
 from app.db.models import Employee
+from app.utils import thumbs
+from app.utils.metrics import stage
 
 router = APIRouter(prefix="/admin", tags=["Admin Pages"])
 
@@ -19,6 +22,7 @@ def admin_ping():
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+templates.env.filters["photo_version"] = thumbs.photo_version
 
 EMPLOYEE_IMG_DIR = Path("employee_photos")
 EMPLOYEE_IMG_DIR.mkdir(parents=True, exist_ok=True)
@@ -35,11 +39,13 @@ def _parse_date(s: Optional[str]) -> Optional[date]:
 
 @router.get("/employees", response_class=HTMLResponse)
 def employees_list(request: Request, db: Session = Depends(get_db)):
-    employees = db.query(Employee).order_by(Employee.id.desc()).all()
-    return templates.TemplateResponse(
-        "employees.html",
-        {"request": request, "employees": employees}
-    )
+    with stage("admin_employees", "employee_query"):
+        employees = db.query(Employee).order_by(Employee.id.desc()).all()
+    with stage("admin_employees", "render"):
+        return templates.TemplateResponse(
+            "employees.html",
+            {"request": request, "employees": employees}
+        )
 
 @router.post("/employees/new")
 async def employees_add(
@@ -65,6 +71,7 @@ async def employees_add(
         with open(disk_path, "wb") as f:
             f.write(await photo.read())
         photo_path = str(disk_path)
+        await run_in_threadpool(thumbs.warm, photo_path)
 
     emp = Employee(
         emp_code=emp_code,
@@ -79,3 +86,72 @@ async def employees_add(
     db.add(emp)
     db.commit()
     return RedirectResponse(url="/admin/employees?ok=1", status_code=303)
+
+
+@router.get("/employees/{emp_id}/thumb")
+def employee_thumb(
+    emp_id: int,
+    request: Request,
+    size: int = Query(thumbs.DEFAULT_SIZE),
+    fmt: str = Query(thumbs.DEFAULT_FORMAT),
+    v: Optional[str] = Query(None, description="Cache-busting token from the list page"),
+    db: Session = Depends(get_db),
+):
+    if size not in thumbs.THUMB_SIZES:
+        raise HTTPException(status_code=422, detail=f"size must be one of {thumbs.THUMB_SIZES}")
+    if fmt not in thumbs.THUMB_FORMATS:
+        raise HTTPException(status_code=422, detail=f"fmt must be one of {sorted(thumbs.THUMB_FORMATS)}")
+
+    emp = db.query(Employee).get(emp_id)
+    src = thumbs.resolve_photo_path(emp.photo_path) if emp else None
+    if src is None:
+        raise HTTPException(status_code=404, detail="Photo not found")
+
+    # answer revalidations before touching (or re-rendering) the cache
+    etag = f'"{thumbs.thumbnail_etag(str(src), size, fmt)}"'
+    # versioned URLs change whenever the photo does, so they can be cached for good
+    cache_control = "public, max-age=31536000, immutable" if v else "public, max-age=300"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if thumbs.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    # another request may evict the cached file between render and read; re-render once
+    for _attempt in range(2):
+        try:
+            path, _ = thumbs.get_thumbnail(str(src), size, fmt)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if path.parent != thumbs.THUMB_DIR:
+            content = None  # original photo (no opencv); never evicted
+            break
+        try:
+            content = path.read_bytes()  # thumbnails are small; read now rather than at send time
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        raise HTTPException(status_code=404, detail="Thumbnail not available")
+
+    if content is None:
+        return FileResponse(path, media_type="image/jpeg", headers=headers)
+    return Response(content=content, media_type=thumbs.THUMB_FORMATS[fmt], headers=headers)
+
+
+@router.post("/photos/gc")
+def photos_gc(
+    dry_run: bool = Query(True, description="Only list orphaned photos, do not delete"),
+    db: Session = Depends(get_db),
+):
+    """
+    Remove employee photos superseded by newer uploads (not referenced by any employee).
+    Photos newer than thumbs.ORPHAN_GRACE_SECONDS are left alone.
+    """
+    rows = db.query(Employee.emp_code, Employee.photo_path).all()
+    referenced = [photo_path for _, photo_path in rows]
+    # never guess for employees whose current photo cannot be located
+    unresolved = [code for code, photo_path in rows if thumbs.resolve_photo_path(photo_path) is None]
+    orphans = thumbs.find_orphan_photos(str(EMPLOYEE_IMG_DIR), referenced, protected_codes=unresolved)
+    if not dry_run:
+        for p in orphans:
+            p.unlink(missing_ok=True)
+    return {"ok": True, "dry_run": dry_run, "orphans": [str(p) for p in orphans]}
@@ -9,6 +9,7 @@ from typing import Optional, Dict
 
 from app.db.base import get_db
 from app.db.models import Employee, Shift, AttendanceLog
+from app.utils.metrics import stage
 
 # Try to use your helper; provide safe fallbacks if files aren't created yet
 try:
@@ -55,21 +56,24 @@ async def checkin(
     Check-in for a known employee code.
     Saves optional snapshot, computes lateness vs default shift, logs an AttendanceLog.
     """
-    emp = db.query(Employee).filter(Employee.emp_code == emp_code).first()
+    with stage("checkin", "employee_query"):
+        emp = db.query(Employee).filter(Employee.emp_code == emp_code).first()
     if not emp:
         raise HTTPException(status_code=404, detail="Employee not found")
 
     # Save snapshot if provided
     snap_path = None
     if frame is not None:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        fname = f"{emp_code}_{ts}.jpg"
-        snap_path = os.path.join(SNAP_DIR, fname)
-        with open(snap_path, "wb") as f:
-            f.write(await frame.read())
+        with stage("checkin", "snapshot_write"):
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            fname = f"{emp_code}_{ts}.jpg"
+            snap_path = os.path.join(SNAP_DIR, fname)
+            with open(snap_path, "wb") as f:
+                f.write(await frame.read())
 
     # Shift & lateness
-    shift = get_or_create_default_shift(db)
+    with stage("checkin", "shift"):
+        shift = get_or_create_default_shift(db)
     now = datetime.now()
     late_min = compute_lateness(now, shift.start_hhmm, shift.grace_minutes)
     status = "present-on-time" if late_min == 0 else "late"
@@ -82,14 +86,16 @@ async def checkin(
         lateness_minutes=late_min,
         snapshot_path=snap_path,
     )
-    db.add(log)
-    db.commit()
-    db.refresh(log)
+    with stage("checkin", "commit"):
+        db.add(log)
+        db.commit()
+        db.refresh(log)
 
     # Voice + response
     msg = f"{emp.full_name} on time" if status == "present-on-time" \
         else f"{emp.full_name} late by {late_min} minutes"
-    say(msg)
+    with stage("checkin", "say"):
+        say(msg)
 
     return {
         "ok": True,
@@ -168,34 +174,37 @@ def monthly_summary(
     y = year or now.year
     m = month or now.month
 
-    emp = db.query(Employee).filter(Employee.emp_code == emp_code).first()
+    with stage("monthly_summary", "employee_query"):
+        emp = db.query(Employee).filter(Employee.emp_code == emp_code).first()
     if not emp:
         raise HTTPException(status_code=404, detail="Employee not found")
 
     start_dt, next_month_dt = _month_bounds(y, m)
-    logs = (
-        db.query(AttendanceLog)
-        .filter(
-            AttendanceLog.employee_id == emp.id,
-            AttendanceLog.ts >= start_dt,
-            AttendanceLog.ts < next_month_dt,
+    with stage("monthly_summary", "logs_query"):
+        logs = (
+            db.query(AttendanceLog)
+            .filter(
+                AttendanceLog.employee_id == emp.id,
+                AttendanceLog.ts >= start_dt,
+                AttendanceLog.ts < next_month_dt,
+            )
+            .order_by(AttendanceLog.ts.asc())
+            .all()
         )
-        .order_by(AttendanceLog.ts.asc())
-        .all()
-    )
 
-    # Group by day -> take earliest record per day
-    first_log_per_day: Dict[date, AttendanceLog] = {}
-    for l in logs:
-        d = l.ts.date()
-        if d not in first_log_per_day:
-            first_log_per_day[d] = l  # earliest because logs sorted asc
+    with stage("monthly_summary", "aggregate"):
+        # Group by day -> take earliest record per day
+        first_log_per_day: Dict[date, AttendanceLog] = {}
+        for l in logs:
+            d = l.ts.date()
+            if d not in first_log_per_day:
+                first_log_per_day[d] = l  # earliest because logs sorted asc
 
-    present_days = len(first_log_per_day)
-    late_days = sum(1 for l in first_log_per_day.values() if l.lateness_minutes > 0)
-    total_late_minutes = sum(l.lateness_minutes for l in first_log_per_day.values())
+        present_days = len(first_log_per_day)
+        late_days = sum(1 for l in first_log_per_day.values() if l.lateness_minutes > 0)
+        total_late_minutes = sum(l.lateness_minutes for l in first_log_per_day.values())
 
-    working_days = _business_days_in_month(y, m)
+        working_days = _business_days_in_month(y, m)
     absent_days = max(0, working_days - present_days)
 
     month_name = calendar.month_name[m]
@@ -204,7 +213,8 @@ def monthly_summary(
         f"{present_days} days present, {late_days} days late, {absent_days} days absent."
     )
     if speak:
-        say(summary_text)
+        with stage("monthly_summary", "say"):
+            say(summary_text)
 
     return {
         "ok": True,
@@ -2,12 +2,15 @@
 
 from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 from datetime import datetime, date
 import os
 
 from app.db.base import get_db
 from app.db.models import Employee
+from app.utils import thumbs
+from app.utils.metrics import stage
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
@@ -47,16 +50,20 @@ async def enroll_employee(
     db: Session = Depends(get_db),
 ):
     # Ensure unique employee code
-    exists = db.query(Employee).filter(Employee.emp_code == emp_code).first()
+    with stage("enroll", "employee_query"):
+        exists = db.query(Employee).filter(Employee.emp_code == emp_code).first()
     if exists:
         raise HTTPException(status_code=409, detail="emp_code already exists")
 
     # Save uploaded photo
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{emp_code}_{ts}.jpg"
-    path = os.path.join(EMPLOYEE_IMG_DIR, filename)
-    with open(path, "wb") as f:
-        f.write(await photo.read())
+    with stage("enroll", "photo_write"):
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{emp_code}_{ts}.jpg"
+        path = os.path.join(EMPLOYEE_IMG_DIR, filename)
+        with open(path, "wb") as f:
+            f.write(await photo.read())
+    with stage("enroll", "thumbnail"):
+        await run_in_threadpool(thumbs.warm, path)
 
     emp = Employee(
         emp_code=emp_code,
@@ -69,9 +76,10 @@ async def enroll_employee(
         notes=notes,
         photo_path=path,
     )
-    db.add(emp)
-    db.commit()
-    db.refresh(emp)
+    with stage("enroll", "commit"):
+        db.add(emp)
+        db.commit()
+        db.refresh(emp)
 
     return {"ok": True, "employee_id": emp.id, "photo_path": path}
 
@@ -79,7 +87,8 @@ async def enroll_employee(
 # ----- read/list -----
 @router.get("")
 def list_employees(db: Session = Depends(get_db)):
-    return db.query(Employee).order_by(Employee.id.desc()).all()
+    with stage("list_employees", "employee_query"):
+        return db.query(Employee).order_by(Employee.id.desc()).all()
 
 
 @router.get("/{emp_id}")
@@ -126,15 +135,19 @@ async def update_employee(
 
     # Optional new photo upload
     if photo is not None:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{emp.emp_code}_{ts}.jpg"
-        path = os.path.join(EMPLOYEE_IMG_DIR, filename)
-        with open(path, "wb") as f:
-            f.write(await photo.read())
-        emp.photo_path = path
-
-    db.commit()
-    db.refresh(emp)
+        with stage("update_employee", "photo_write"):
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"{emp.emp_code}_{ts}.jpg"
+            path = os.path.join(EMPLOYEE_IMG_DIR, filename)
+            with open(path, "wb") as f:
+                f.write(await photo.read())
+            emp.photo_path = path
+        with stage("update_employee", "thumbnail"):
+            await run_in_threadpool(thumbs.warm, path)
+
+    with stage("update_employee", "commit"):
+        db.commit()
+        db.refresh(emp)
     return {"ok": True, "employee": emp}
 
 
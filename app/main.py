@@ -1,11 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from app.db.base import Base, engine
 from app.api import employees, attendance
 from app.admin import routes as admin_routes
+from app.utils.metrics import MetricsMiddleware, render_latest
 
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI(title="Face Attendance API", version="0.1.0", docs_url="/docs", redoc_url="/redoc")
+app.add_middleware(MetricsMiddleware)   # request latency + optional Server-Timing
 
 @app.get("/")
 def root(): return {"ok": True, "msg": "API is running"}
@@ -13,6 +16,9 @@ def root(): return {"ok": True, "msg": "API is running"}
 @app.get("/test")
 def test(): return {"ok": True, "msg": "Test endpoint is working"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(): return PlainTextResponse(render_latest(), media_type="text/plain; version=0.0.4")
+
 app.include_router(employees.router)
 app.include_router(attendance.router)
 app.include_router(admin_routes.router)   # admin pages
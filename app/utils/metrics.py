@@ -0,0 +1,166 @@
+"""
+Lightweight in-process metrics: counters and histograms rendered in the
+Prometheus text format, per-stage timers and an ASGI middleware that times
+every request and can emit a Server-Timing header.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+# Seconds; covers sub-ms DB lookups up to multi-second TTS calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Set FA_SERVER_TIMING=1 to add a Server-Timing header to every response
+SERVER_TIMING = os.getenv("FA_SERVER_TIMING", "0") == "1"
+
+# Stages recorded during the current request (None outside a request)
+_stages: ContextVar[Optional[list]] = ContextVar("_stages", default=None)
+
+REGISTRY: list = []
+
+
+def _fmt_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{v}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, doc: str, labelnames: tuple = ()):
+        self.name, self.doc, self.labelnames = name, doc, labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        out = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, v in items:
+            out.append(f"{self.name}{_fmt_labels(self.labelnames, labels)} {v}")
+        return out
+
+
+class Histogram:
+    def __init__(self, name: str, doc: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name, self.doc, self.labelnames = name, doc, labelnames
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value: float, *labels) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[i] += 1
+            row[-1] += value
+
+    def render(self) -> list[str]:
+        out = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for labels, row in items:
+            cum = 0
+            for le, n in zip(self.buckets, row):
+                cum += n
+                bucket = _fmt_labels(self.labelnames, labels, f'le="{le}"')
+                out.append(f"{self.name}_bucket{bucket} {cum}")
+            cum += row[len(self.buckets)]
+            bucket = _fmt_labels(self.labelnames, labels, 'le="+Inf"')
+            out.append(f"{self.name}_bucket{bucket} {cum}")
+            out.append(f"{self.name}_sum{_fmt_labels(self.labelnames, labels)} {row[-1]}")
+            out.append(f"{self.name}_count{_fmt_labels(self.labelnames, labels)} {cum}")
+        return out
+
+
+REQUESTS_TOTAL = Counter(
+    "http_requests_total", "HTTP requests handled", ("method", "route", "status"))
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+STAGE_LATENCY = Histogram(
+    "handler_stage_duration_seconds", "Latency of individual handler stages", ("handler", "stage"))
+STAGE_ERRORS = Counter(
+    "handler_stage_errors_total", "Handler stages that raised", ("handler", "stage"))
+
+
+def render_latest() -> str:
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def stage(handler: str, name: str):
+    """Time one stage of a handler, e.g. `with stage("checkin", "commit"): db.commit()`."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(handler, name)
+        raise
+    finally:
+        dt = time.perf_counter() - t0
+        STAGE_LATENCY.observe(dt, handler, name)
+        recorded = _stages.get()
+        if recorded is not None:
+            recorded.append((name, dt))
+
+
+def _server_timing(stages: list, total: float) -> bytes:
+    parts = [f"{name};dur={dt * 1000:.2f}" for name, dt in stages]
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class MetricsMiddleware:
+    """Plain ASGI middleware (no BaseHTTPMiddleware) to keep per-request overhead small."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        recorded: list = []
+        token = _stages.set(recorded)
+        t0 = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(recorded, time.perf_counter() - t0)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _stages.reset(token)
+            dt = time.perf_counter() - t0
+            # route template (not raw path) keeps label cardinality bounded
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or "<unmatched>"
+            method = scope.get("method", "")
+            REQUEST_LATENCY.observe(dt, method, route_label)
+            REQUESTS_TOTAL.inc(method, route_label, str(status))
@@ -0,0 +1,229 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+# opencv is already a project dependency; fall back to serving originals without it
+try:
+    import cv2
+except Exception:
+    cv2 = None
+
+THUMB_DIR = Path("thumbnails")
+THUMB_DIR.mkdir(parents=True, exist_ok=True)
+
+THUMB_SIZES = (64, 96, 128, 256)     # longest edge, px
+DEFAULT_SIZE = 96
+THUMB_FORMATS = {"webp": "image/webp", "jpeg": "image/jpeg"}
+DEFAULT_FORMAT = "webp"
+
+# On-disk LRU budget; least recently served thumbnails are evicted first
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Uploads are written before the employee row is committed; never GC anything this fresh
+ORPHAN_GRACE_SECONDS = 60 * 60
+
+_cache_bytes: Optional[int] = None
+# sync routes run in the thread pool; guards _cache_bytes and eviction
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8192)
+def _hash_file(path: str, size: int, mtime_ns: int) -> str:
+    # size/mtime are part of the key so a rewritten file is re-hashed
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def photo_hash(path: str) -> str:
+    """Content hash of a photo, cached by (path, size, mtime)."""
+    st = os.stat(path)
+    return _hash_file(str(path), st.st_size, st.st_mtime_ns)
+
+
+def resolve_photo_path(path: Optional[str]) -> Optional[Path]:
+    """
+    Stored photo_path as an existing file, or None. Rows written on Windows hold
+    backslash paths (employee_photos\\Emp001_....jpg); normalise them so they resolve anywhere.
+    """
+    if not path:
+        return None
+    p = Path(path.replace("\\", "/"))
+    return p if p.is_file() else None
+
+
+def photo_version(path: Optional[str]) -> str:
+    """Cheap cache-busting token for URLs (no file read)."""
+    p = resolve_photo_path(path)
+    if p is None:
+        return ""
+    try:
+        st = p.stat()
+    except OSError:
+        return ""
+    return f"{st.st_mtime_ns:x}{st.st_size:x}"
+
+
+def _cache_files() -> list[Path]:
+    # skip in-flight renders; their temp files are renamed or removed by _render
+    return [p for p in THUMB_DIR.iterdir() if p.is_file() and p.suffix != ".tmp"]
+
+
+def _scan_cache() -> list[os.stat_result]:
+    return [p.stat() for p in _cache_files()]
+
+
+def _evict() -> None:
+    """
+    Drop least recently used thumbnails until the cache is under 90% of budget.
+    Callers hold _cache_lock.
+    """
+    global _cache_bytes
+    entries = sorted(
+        ((p, p.stat()) for p in _cache_files()),
+        key=lambda e: e[1].st_mtime,
+    )
+    total = sum(st.st_size for _, st in entries)
+    target = int(CACHE_MAX_BYTES * 0.9)
+    for p, st in entries:
+        if total <= target:
+            break
+        try:
+            p.unlink()
+            total -= st.st_size
+        except OSError:
+            continue
+    _cache_bytes = total
+
+
+def _render(src: str, dest: Path, size: int, fmt: str) -> None:
+    img = cv2.imread(src, cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError(f"unreadable image: {src}")
+    h, w = img.shape[:2]
+    scale = size / max(h, w)
+    if scale < 1:
+        img = cv2.resize(img, (max(1, int(w * scale)), max(1, int(h * scale))),
+                         interpolation=cv2.INTER_AREA)
+    if fmt == "webp":
+        ok, buf = cv2.imencode(".webp", img, [cv2.IMWRITE_WEBP_QUALITY, 80])
+    else:
+        ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 80])
+    if not ok:
+        raise ValueError(f"failed to encode thumbnail: {src}")
+
+    # write-then-rename so concurrent readers never see a partial file;
+    # a unique temp name per render keeps racing requests from clobbering each other
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=dest.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf.tobytes())
+        if not dest.exists():
+            os.replace(tmp, dest)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def thumbnail_etag(src: str, size: int = DEFAULT_SIZE, fmt: str = DEFAULT_FORMAT) -> str:
+    """ETag of the thumbnail get_thumbnail() would serve, without rendering it."""
+    digest = photo_hash(src)
+    return digest if cv2 is None else f"{digest}-{size}-{fmt}"
+
+
+def get_thumbnail(src: str, size: int = DEFAULT_SIZE, fmt: str = DEFAULT_FORMAT) -> tuple[Path, str]:
+    """
+    Return (path, etag) of a cached thumbnail for `src`, generating it if needed.
+    Without opencv the original photo is returned as-is.
+    """
+    global _cache_bytes
+    etag = thumbnail_etag(src, size, fmt)
+    if cv2 is None:
+        return Path(src), etag
+
+    dest = THUMB_DIR / f"{etag}.{fmt}"
+    if dest.exists():
+        # refresh mtime so eviction treats it as recently used
+        try:
+            os.utime(dest)
+        except OSError:
+            pass
+        return dest, etag
+
+    _render(src, dest, size, fmt)
+    with _cache_lock:
+        if _cache_bytes is None:
+            _cache_bytes = sum(st.st_size for st in _scan_cache())
+        else:
+            try:
+                _cache_bytes += dest.stat().st_size
+            except OSError:
+                pass
+        if _cache_bytes > CACHE_MAX_BYTES:
+            _evict()
+    return dest, etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True if an If-None-Match header matches `etag` (weak comparison, per RFC 9110):
+    handles `*`, comma-separated lists and `W/` prefixes. `etag` may be quoted or bare.
+    """
+    if not if_none_match:
+        return False
+    want = etag.strip().removeprefix("W/").strip('"')
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.removeprefix("W/").strip('"') == want:
+            return True
+    return False
+
+
+def warm(src: Optional[str]) -> None:
+    """
+    Pre-generate the default thumbnail at upload time; never fails the caller.
+    CPU-bound (hash + decode + encode): call it via run_in_threadpool from async handlers.
+    """
+    if not src:
+        return
+    try:
+        get_thumbnail(src)
+    except Exception:
+        pass
+
+
+def _path_key(path) -> str:
+    return os.path.normcase(os.path.abspath(str(path).replace("\\", "/")))
+
+
+def find_orphan_photos(
+    photo_dir: str,
+    referenced: Iterable[Optional[str]],
+    min_age_seconds: float = ORPHAN_GRACE_SECONDS,
+    protected_codes: Iterable[str] = (),
+) -> list[Path]:
+    """
+    Photos in `photo_dir` that no employee points at any more (superseded uploads).
+    Files modified within `min_age_seconds` are skipped as possibly not yet committed,
+    and so is anything named after one of `protected_codes` (employees whose stored
+    photo_path does not resolve, so we cannot tell which of their files is current).
+    """
+    keep = {_path_key(p) for p in referenced if p}
+    prefixes = tuple(f"{code}_" for code in protected_codes)
+    cutoff = time.time() - min_age_seconds
+    return [
+        p for p in sorted(Path(photo_dir).iterdir())
+        if p.is_file()
+        and _path_key(p) not in keep
+        and not (prefixes and p.name.startswith(prefixes))
+        and p.stat().st_mtime < cutoff
+    ]
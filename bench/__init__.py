@@ -0,0 +1 @@
+"""Load-test and benchmark suite; see bench/run.py for usage."""
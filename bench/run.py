@@ -0,0 +1,229 @@
+"""
+Run the benchmark suite in-process against the FastAPI app.
+
+    python -m bench.run --employees 500 --months 6 --requests 300 --out bench.json
+    python -m bench.run --compare bench.json          # diff a new run against an old report
+
+Everything happens inside a throwaway working directory (SQLite DB, photos,
+snapshots, thumbnails), so no camera, network or existing data is touched.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Fixed anchor so seeded history is identical no matter when the benchmark runs
+DEFAULT_TODAY = "2025-06-30"
+
+PARAM_KEYS = ("employees", "months", "requests", "warmup", "concurrency", "seed", "today")
+
+
+def percentile(sorted_vals: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_vals:
+        return 0.0
+    k = max(0, min(len(sorted_vals) - 1, math.ceil(pct / 100 * len(sorted_vals)) - 1))
+    return sorted_vals[k]
+
+
+def summarize(latencies: list[float], errors: int, wall: float) -> dict:
+    s = sorted(latencies)
+    n = len(s)
+    return {
+        "requests": n,
+        "errors": errors,
+        "wall_seconds": round(wall, 4),
+        "throughput_rps": round(n / wall, 2) if wall > 0 else 0.0,
+        "mean_ms": round(sum(s) / n * 1000, 3) if n else 0.0,
+        "p50_ms": round(percentile(s, 50) * 1000, 3),
+        "p95_ms": round(percentile(s, 95) * 1000, 3),
+        "p99_ms": round(percentile(s, 99) * 1000, 3),
+        "max_ms": round(s[-1] * 1000, 3) if n else 0.0,
+    }
+
+
+def _timed(req) -> tuple[float, bool]:
+    t0 = time.perf_counter()
+    r = req()
+    return time.perf_counter() - t0, r.status_code < 400
+
+
+def run_scenario(requests: list, warmup: int, concurrency: int) -> dict:
+    for req in requests[:warmup]:
+        req()
+    todo = requests[warmup:]
+
+    t0 = time.perf_counter()
+    if concurrency > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(_timed, todo))
+    else:
+        results = [_timed(req) for req in todo]
+    wall = time.perf_counter() - t0
+
+    latencies = [dt for dt, _ in results]
+    errors = sum(1 for _, ok in results if not ok)
+    return summarize(latencies, errors, wall)
+
+
+def _git_rev() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run(args) -> dict:
+    # app modules create their DB/dirs relative to cwd at import time,
+    # so switch to the scratch dir before importing anything from app
+    os.chdir(args.workdir)
+    sys.path.insert(0, str(REPO_ROOT))
+
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db.base import SessionLocal
+    from bench.seed import seed
+    from bench.scenarios import SCENARIOS
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = sorted(set(names) - set(SCENARIOS))
+    if unknown:
+        raise SystemExit(f"unknown scenario(s): {', '.join(unknown)}; choose from {', '.join(SCENARIOS)}")
+
+    if not args.tts:
+        from app.api import attendance
+        attendance.say = lambda _text: None
+
+    rng = random.Random(args.seed)
+    t0 = time.perf_counter()
+    db = SessionLocal()
+    try:
+        seeded = seed(db, args.employees, args.months, rng=rng, today=args.today)
+    finally:
+        db.close()
+    seeded["seconds"] = round(time.perf_counter() - t0, 3)
+
+    results = {}
+    # app errors must land in the per-scenario `errors` count, not abort the run
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for name in names:
+            factory = SCENARIOS[name]
+            kwargs = {"months": args.months, "today": args.today} if name == "monthly_summary" else {}
+            reqs = factory(client, rng, args.employees, args.requests + args.warmup, **kwargs)
+            results[name] = run_scenario(reqs, args.warmup, args.concurrency)
+            print(f"{name:18s} {results[name]['throughput_rps']:>9.1f} rps  "
+                  f"p50 {results[name]['p50_ms']:>8.2f} ms  p95 {results[name]['p95_ms']:>8.2f} ms  "
+                  f"p99 {results[name]['p99_ms']:>8.2f} ms  errors {results[name]['errors']}",
+                  file=sys.stderr)
+
+    return {
+        "meta": {
+            "app_version": app.version,
+            "git_rev": _git_rev(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": _params(args),
+        },
+        "seed": seeded,
+        "scenarios": results,
+    }
+
+
+def _params(args) -> dict:
+    params = {k: getattr(args, k) for k in PARAM_KEYS}
+    params["today"] = args.today.isoformat()
+    return params
+
+
+def compare(old: dict, new: dict) -> dict:
+    """
+    Relative change (new / old - 1) of the headline numbers per scenario.
+    Runs with different parameters measure different workloads, so no deltas are
+    produced for them; the mismatching params are reported instead.
+    """
+    old_params = old.get("meta", {}).get("params", {})
+    new_params = new["meta"]["params"]
+    mismatch = {
+        k: {"baseline": old_params.get(k), "current": new_params.get(k)}
+        for k in PARAM_KEYS if old_params.get(k) != new_params.get(k)
+    }
+    if mismatch:
+        return {"warning": "params differ; deltas not computed", "params_mismatch": mismatch, "delta": None}
+
+    delta = {}
+    for name, cur in new["scenarios"].items():
+        prev = old.get("scenarios", {}).get(name)
+        if not prev:
+            continue
+        delta[name] = {
+            key: round(cur[key] / prev[key] - 1, 4) if prev[key] else None
+            for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+        }
+    return {"delta": delta}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Face attendance load test / benchmark")
+    p.add_argument("--employees", type=int, default=200)
+    p.add_argument("--months", type=int, default=3)
+    p.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    p.add_argument("--warmup", type=int, default=10)
+    p.add_argument("--concurrency", type=int, default=1)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--today", type=date.fromisoformat, default=date.fromisoformat(DEFAULT_TODAY),
+                   help=f"anchor date (YYYY-MM-DD); seeds whole months ending with its month "
+                        f"(default: {DEFAULT_TODAY})")
+    p.add_argument("--scenarios", nargs="*", help="subset to run (default: all)")
+    p.add_argument("--tts", action="store_true", help="keep text-to-speech enabled")
+    p.add_argument("--workdir", help="empty scratch dir to keep artifacts (default: fresh temp dir)")
+    p.add_argument("--out", help="write JSON report here (default: stdout)")
+    p.add_argument("--compare", help="previous JSON report to diff against")
+    args = p.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+    if args.out:
+        args.out = str(Path(args.out).resolve())
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="fa-bench-") as tmp:
+        args.workdir = str(Path(args.workdir).resolve()) if args.workdir else tmp
+        os.makedirs(args.workdir, exist_ok=True)
+        try:
+            report = run(args)
+        finally:
+            # leave the scratch dir so it can be removed (required on Windows)
+            os.chdir(cwd)
+
+    if baseline is not None:
+        report["compare"] = {"baseline": args.compare, **compare(baseline, report)}
+        if "warning" in report["compare"]:
+            print(f"compare: {report['compare']['warning']}: {report['compare']['params_mismatch']}",
+                  file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Benchmark scenarios. Each one builds a list of request callables against the
+in-process ASGI test client; the runner times them.
+"""
+import random
+from datetime import date
+from typing import Callable, Optional
+
+from bench.seed import emp_code, make_frame
+
+Request = Callable[[], object]
+
+
+def checkin_burst(client, rng: random.Random, employees: int, n: int) -> list[Request]:
+    """Back-to-back kiosk check-ins with a snapshot frame, random employees."""
+    frames = [make_frame(rng) for _ in range(8)]
+
+    def one(code: str, frame: bytes) -> Request:
+        return lambda: client.post(
+            "/attendance/checkin",
+            data={"emp_code": code},
+            files={"frame": ("frame.jpg", frame, "image/jpeg")},
+        )
+
+    return [one(emp_code(rng.randint(1, employees)), rng.choice(frames)) for _ in range(n)]
+
+
+def monthly_summary(
+    client, rng: random.Random, employees: int, n: int, months: int = 1, today: Optional[date] = None,
+) -> list[Request]:
+    """Monthly summaries for random employees across the seeded months (ending at `today`)."""
+    today = today or date.today()
+    reqs = []
+    for _ in range(n):
+        back = rng.randrange(max(1, months))
+        y, m = today.year, today.month - back
+        while m <= 0:
+            m += 12
+            y -= 1
+        params = {"emp_code": emp_code(rng.randint(1, employees)), "year": y, "month": m}
+        reqs.append(lambda p=params: client.get("/attendance/monthly_summary", params=p))
+    return reqs
+
+
+def list_employees(client, rng: random.Random, employees: int, n: int) -> list[Request]:
+    """Full employee listing (JSON API)."""
+    return [lambda: client.get("/employees") for _ in range(n)]
+
+
+def admin_employees(client, rng: random.Random, employees: int, n: int) -> list[Request]:
+    """Admin employee page (HTML render over every employee)."""
+    return [lambda: client.get("/admin/employees") for _ in range(n)]
+
+
+def export_today(client, rng: random.Random, employees: int, n: int) -> list[Request]:
+    """
+    Dump of today's attendance logs; the closest thing to an export the API has.
+    The endpoint always uses the wall-clock date, which seed() fills with one regular day.
+    """
+    return [lambda: client.get("/attendance/today") for _ in range(n)]
+
+
+SCENARIOS = {
+    "checkin_burst": checkin_burst,
+    "monthly_summary": monthly_summary,
+    "list_employees": list_employees,
+    "admin_employees": admin_employees,
+    "export_today": export_today,
+}
@@ -0,0 +1,151 @@
+"""Synthetic workforce data: employees, AttendanceLog history and camera frames."""
+import calendar
+import os
+import random
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Employee, AttendanceLog
+from app.api.attendance import get_or_create_default_shift
+from app.utils.timeutils import compute_lateness
+
+try:
+    import cv2
+    import numpy as np
+except Exception:
+    cv2 = None
+
+DEPARTMENTS = ("Engineering", "Operations", "Sales", "Finance", "HR", "Support")
+DESIGNATIONS = ("Associate", "Engineer", "Senior Engineer", "Lead", "Manager")
+FIRST = ("Amina", "Rahim", "Nusrat", "Karim", "Priya", "John", "Mei", "Omar", "Sara", "Ivan")
+LAST = ("Hossain", "Biswas", "Khan", "Das", "Smith", "Chen", "Ali", "Roy", "Sen", "Novak")
+
+CHUNK = 5000
+
+
+def make_frame(rng: random.Random, width: int = 640, height: int = 480) -> bytes:
+    """
+    A synthetic webcam frame as JPEG bytes. Real JPEG via opencv when available;
+    otherwise an opaque blob of similar size framed by SOI/EOI markers, which is
+    enough for endpoints that only store the upload.
+    """
+    if cv2 is not None:
+        gen = np.random.default_rng(rng.getrandbits(32))
+        img = gen.integers(0, 256, size=(height // 8, width // 8, 3), dtype=np.uint8)
+        img = cv2.resize(img, (width, height), interpolation=cv2.INTER_LINEAR)
+        ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        if ok:
+            return buf.tobytes()
+    return b"\xff\xd8" + rng.randbytes(width * height // 10) + b"\xff\xd9"
+
+
+def emp_code(i: int) -> str:
+    return f"Emp{i:06d}"
+
+
+def _month_start(d: date, months_back: int) -> date:
+    y, m = d.year, d.month - months_back
+    while m <= 0:
+        m += 12
+        y -= 1
+    return date(y, m, 1)
+
+
+def _month_end(d: date) -> date:
+    return date(d.year, d.month, calendar.monthrange(d.year, d.month)[1])
+
+
+def _day_logs(rng: random.Random, ids: list[int], d: date, shift, attendance_rate: float) -> list[dict]:
+    """First check-in around shift start for most employees, occasional second punch."""
+    hh, mm = map(int, shift.start_hhmm.split(":"))
+    base = datetime.combine(d, time(hh, mm))
+    rows = []
+    for emp_id in ids:
+        if rng.random() > attendance_rate:
+            continue
+        ts = base + timedelta(minutes=rng.gauss(-5, 12))
+        rows.append({
+            "employee_id": emp_id,
+            "ts": ts,
+            "status": "present",
+            "lateness_minutes": compute_lateness(ts, shift.start_hhmm, shift.grace_minutes),
+        })
+        if rng.random() < 0.1:
+            rows.append({"employee_id": emp_id, "ts": ts + timedelta(hours=4),
+                         "status": "present", "lateness_minutes": 0})
+    return rows
+
+
+def seed(
+    db: Session,
+    employees: int,
+    months: int,
+    photo_dir: str = "employee_photos",
+    rng: Optional[random.Random] = None,
+    attendance_rate: float = 0.92,
+    today: Optional[date] = None,
+) -> dict:
+    """
+    Insert `employees` employees (each with one photo on disk) and `months` whole
+    calendar months of weekday check-ins, ending with the month containing `today`
+    (the benchmark's fixed anchor date, not the wall clock).
+
+    The API's /attendance/today always reads the real current date, so that day also
+    gets one regular day of check-ins, whatever weekday it is; this keeps the export
+    workload independent of when the benchmark runs. Returns counts for the report.
+    """
+    rng = rng or random.Random(0)
+    today = today or date.today()
+    shift = get_or_create_default_shift(db)
+    os.makedirs(photo_dir, exist_ok=True)
+
+    # Employees + photos; one shared frame keeps seeding fast for large N
+    photo = make_frame(rng, 320, 240)
+    rows = []
+    for i in range(1, employees + 1):
+        code = emp_code(i)
+        path = os.path.join(photo_dir, f"{code}_seed.jpg")
+        with open(path, "wb") as f:
+            f.write(photo)
+        rows.append({
+            "emp_code": code,
+            "full_name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            "department": rng.choice(DEPARTMENTS),
+            "designation": rng.choice(DESIGNATIONS),
+            "email": f"{code.lower()}@example.com",
+            "joining_date": today - timedelta(days=rng.randint(30, 3650)),
+            "photo_path": path,
+        })
+    for k in range(0, len(rows), CHUNK):
+        db.bulk_insert_mappings(Employee, rows[k:k + CHUNK])
+    db.commit()
+    ids = [i for (i,) in db.query(Employee.id).all()]
+
+    # AttendanceLog history over whole months
+    start = _month_start(today, max(months, 1) - 1)
+    end = _month_end(today) if months > 0 else start - timedelta(days=1)
+    logs = 0
+    batch = []
+    d = start
+    while d <= end:
+        if d.weekday() < 5:
+            batch.extend(_day_logs(rng, ids, d, shift, attendance_rate))
+            if len(batch) >= CHUNK:
+                db.bulk_insert_mappings(AttendanceLog, batch)
+                logs += len(batch)
+                batch = []
+        d += timedelta(days=1)
+
+    # the wall-clock day, unless the history already seeded it as a weekday
+    live_day = date.today()
+    if not (start <= live_day <= end and live_day.weekday() < 5):
+        batch.extend(_day_logs(rng, ids, live_day, shift, attendance_rate))
+    if batch:
+        db.bulk_insert_mappings(AttendanceLog, batch)
+        logs += len(batch)
+    db.commit()
+
+    return {"employees": len(ids), "months": months, "attendance_logs": logs,
+            "from": start.isoformat(), "to": end.isoformat()}
@@ -0,0 +1,54 @@
+from bench.run import compare, percentile, summarize
+
+
+def _report(params, **scenarios):
+    return {"meta": {"params": params}, "scenarios": scenarios}
+
+
+def test_percentile_nearest_rank():
+    vals = list(range(1, 101))
+    assert percentile(vals, 50) == 50
+    assert percentile(vals, 95) == 95
+    assert percentile(vals, 99) == 99
+    assert percentile(vals, 100) == 100
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_empty_and_basic():
+    empty = summarize([], errors=0, wall=0.0)
+    assert empty["requests"] == 0
+    assert empty["throughput_rps"] == 0.0
+    assert empty["p99_ms"] == 0.0 and empty["max_ms"] == 0.0
+
+    s = summarize([0.003, 0.001, 0.002, 0.004], errors=1, wall=0.5)
+    assert s["requests"] == 4 and s["errors"] == 1
+    assert s["throughput_rps"] == 8.0
+    assert s["p50_ms"] == 2.0
+    assert s["p99_ms"] == 4.0
+    assert s["mean_ms"] == 2.5
+
+
+def test_compare_deltas_for_matching_params():
+    params = {"employees": 100, "today": "2025-06-30"}
+    old = _report(params, list_employees={"throughput_rps": 100.0, "p50_ms": 2.0, "p95_ms": 4.0, "p99_ms": 0})
+    new = _report(params, list_employees={"throughput_rps": 110.0, "p50_ms": 1.0, "p95_ms": 4.0, "p99_ms": 5.0})
+
+    out = compare(old, new)
+
+    assert "warning" not in out
+    assert out["delta"]["list_employees"] == {
+        "throughput_rps": 0.1, "p50_ms": -0.5, "p95_ms": 0.0, "p99_ms": None,
+    }
+
+
+def test_compare_refuses_when_params_differ():
+    stats = {"throughput_rps": 1.0, "p50_ms": 1.0, "p95_ms": 1.0, "p99_ms": 1.0}
+    old = _report({"employees": 100, "today": "2025-06-30"}, checkin_burst=stats)
+    new = _report({"employees": 5000, "today": "2025-06-30"}, checkin_burst=stats)
+
+    out = compare(old, new)
+
+    assert out["delta"] is None
+    assert out["params_mismatch"] == {"employees": {"baseline": 100, "current": 5000}}
+    assert "warning" in out
@@ -0,0 +1,75 @@
+import pytest
+
+from app.utils import metrics
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    reg = []
+    monkeypatch.setattr(metrics, "REGISTRY", reg)
+    return reg
+
+
+def test_histogram_render_is_cumulative(registry):
+    h = metrics.Histogram("t_seconds", "test histogram", ("stage",), buckets=(0.1, 0.5, 1.0))
+    for v in (0.05, 0.1, 0.3, 0.7, 2.0):  # 0.1 sits exactly on a boundary (le is inclusive)
+        h.observe(v, "db")
+
+    lines = h.render()
+
+    assert lines[:2] == ["# HELP t_seconds test histogram", "# TYPE t_seconds histogram"]
+    assert 't_seconds_bucket{stage="db",le="0.1"} 2' in lines
+    assert 't_seconds_bucket{stage="db",le="0.5"} 3' in lines
+    assert 't_seconds_bucket{stage="db",le="1.0"} 4' in lines
+    assert 't_seconds_bucket{stage="db",le="+Inf"} 5' in lines
+    assert 't_seconds_count{stage="db"} 5' in lines
+    sum_line = next(l for l in lines if l.startswith("t_seconds_sum"))
+    assert float(sum_line.split()[-1]) == pytest.approx(3.15)
+
+
+def test_render_latest_format(registry):
+    c = metrics.Counter("t_total", "test counter", ("method", "status"))
+    c.inc("GET", "200")
+    c.inc("GET", "200", amount=2)
+    metrics.Histogram("t_empty_seconds", "no observations")
+
+    text = metrics.render_latest()
+
+    assert text.endswith("\n")
+    assert text.splitlines() == [
+        "# HELP t_total test counter",
+        "# TYPE t_total counter",
+        't_total{method="GET",status="200"} 3',
+        "# HELP t_empty_seconds no observations",
+        "# TYPE t_empty_seconds histogram",
+    ]
+
+
+def test_middleware_labels_route_template_and_server_timing(monkeypatch):
+    fastapi = pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(metrics, "SERVER_TIMING", True)
+    monkeypatch.setattr(metrics.REQUESTS_TOTAL, "_values", {})
+    monkeypatch.setattr(metrics.REQUEST_LATENCY, "_values", {})
+
+    app = fastapi.FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        with metrics.stage("item", "lookup"):
+            pass
+        return {"id": item_id}
+
+    client = TestClient(app)
+    r = client.get("/items/42")
+    client.get("/nope")
+
+    assert r.status_code == 200
+    timing = r.headers["server-timing"]
+    assert "lookup;dur=" in timing and "total;dur=" in timing
+    assert metrics.REQUESTS_TOTAL._values[("GET", "/items/{item_id}", "200")] == 1
+    assert ("GET", "/items/42", "200") not in metrics.REQUESTS_TOTAL._values
+    assert metrics.REQUESTS_TOTAL._values[("GET", "<unmatched>", "404")] == 1
+    assert ("GET", "/items/{item_id}") in metrics.REQUEST_LATENCY._values
@@ -0,0 +1,78 @@
+import os
+import time
+
+import pytest
+
+from app.utils import thumbs
+
+
+@pytest.fixture
+def thumb_dir(tmp_path, monkeypatch):
+    d = tmp_path / "thumbnails"
+    d.mkdir()
+    monkeypatch.setattr(thumbs, "THUMB_DIR", d)
+    monkeypatch.setattr(thumbs, "_cache_bytes", None)
+    return d
+
+
+def _write(path, size, age_seconds=0):
+    path.write_bytes(b"x" * size)
+    t = time.time() - age_seconds
+    os.utime(path, (t, t))
+    return path
+
+
+def test_find_orphan_photos_keeps_referenced_and_fresh(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    photos = tmp_path / "employee_photos"
+    photos.mkdir()
+    current = _write(photos / "Emp001_new.jpg", 10, age_seconds=7200)
+    old = _write(photos / "Emp001_old.jpg", 10, age_seconds=7200)
+    fresh = _write(photos / "Emp002_uncommitted.jpg", 10)
+    # rows written on Windows store relative backslash paths
+    _write(photos / "Emp003_20250814_122730.jpg", 10, age_seconds=7200)
+    windows_path = "employee_photos\\Emp003_20250814_122730.jpg"
+
+    orphans = thumbs.find_orphan_photos("employee_photos", [str(current), windows_path, None])
+
+    assert [p.name for p in orphans] == [old.name]
+    assert fresh not in orphans
+    assert thumbs.resolve_photo_path(windows_path) is not None
+
+
+def test_find_orphan_photos_protects_unresolved_employees(tmp_path):
+    photos = tmp_path / "employee_photos"
+    photos.mkdir()
+    _write(photos / "Emp003_a.jpg", 10, age_seconds=7200)
+    other = _write(photos / "Emp0030_a.jpg", 10, age_seconds=7200)
+
+    orphans = thumbs.find_orphan_photos(str(photos), ["missing/Emp003_x.jpg"], protected_codes=["Emp003"])
+
+    assert orphans == [other]
+
+
+def test_evict_stays_under_budget_and_drops_oldest(thumb_dir, monkeypatch):
+    monkeypatch.setattr(thumbs, "CACHE_MAX_BYTES", 1000)
+    files = [_write(thumb_dir / f"t{i}.webp", 200, age_seconds=100 - i) for i in range(8)]
+    inflight = _write(thumb_dir / "t9.webp123.tmp", 200, age_seconds=1000)
+
+    thumbs._evict()
+
+    remaining = [p for p in files if p.exists()]
+    assert sum(p.stat().st_size for p in remaining) <= 900
+    assert thumbs._cache_bytes <= 900
+    # least recently used go first
+    assert remaining == files[-len(remaining):]
+    assert inflight.exists()
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"zzz", W/"abc"', True),
+    ("*", True),
+    ('"zzz"', False),
+    (None, False),
+])
+def test_etag_matches(header, expected):
+    assert thumbs.etag_matches(header, '"abc"') is expected